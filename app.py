@@ -1,48 +1,119 @@
 import os
 import re
 import io
-import json
+import queue
+import struct
+import hashlib
+import asyncio
+import tempfile
+import threading
+import time
+import stat
 from datetime import datetime
+from pathlib import Path
+from functools import lru_cache, partial
 from urllib.parse import urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
-from flask import Flask, render_template, request, send_file, jsonify, Response
+from flask import Flask, render_template, request, send_file, send_from_directory, jsonify, Response
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import httpx
+import orjson
+from cachetools import TTLCache
+from selectolax.lexbor import LexborHTMLParser
 from PIL import Image
 import img2pdf
 from pptx import Presentation
 from pptx.util import Inches
 
+try:
+    from uvloop import new_event_loop
+except ImportError:
+    new_event_loop = asyncio.new_event_loop
+
 app = Flask(__name__)
 app.secret_key = os.environ.get("SESSION_SECRET", "slideshare-downloader-secret-key")
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 3600
 
 SITE_DOMAIN = "slidesharedownloaderfree.com"
 SITE_URL = f"https://{SITE_DOMAIN}"
 
-SESSION = requests.Session()
-SESSION.headers.update({
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+IMAGE_HEADERS = {
+    'User-Agent': USER_AGENT,
     'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
     'Accept-Language': 'en-US,en;q=0.5',
-    'Connection': 'keep-alive',
-})
+}
+IMAGE_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+IMAGE_RETRIES = 2
+IMAGE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix='slide-image')
+IMAGE_FORMATS = ('JPEG', 'WEBP', 'PNG')
+PPTX_MAX_SIZE = (1600, 1200)
+_JPEG_BUFFERS = queue.SimpleQueue()
+IMAGE_CACHE_MAX_BYTES = 512 << 20
+IMAGE_CACHE_SWEEP_INTERVAL = 60
+_LAST_CACHE_SWEEP = 0.0
+_SWEEP_LOCK = threading.Lock()
+_IMAGE_LOOP = None
+_IMAGE_LOOP_PID = None
+_IMAGE_LOOP_LOCK = threading.Lock()
+_IMAGE_CLIENT = None
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
 
 HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'User-Agent': USER_AGENT,
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
 }
 
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+)
+SESSION.mount('https://', _ADAPTER)
+SESSION.mount('http://', _ADAPTER)
+
+MAX_URL_LENGTH = 2048
+_VALID_DOMAINS = frozenset({
+    'www.slideshare.net', 'slideshare.net', 'pt.slideshare.net',
+    'de.slideshare.net', 'es.slideshare.net', 'fr.slideshare.net',
+})
+
+_EXTRACT_CACHE = TTLCache(maxsize=1024, ttl=600)
+_EXTRACT_MISS_CACHE = TTLCache(maxsize=1024, ttl=60)
+_EXTRACT_LOCK = threading.Lock()
+
+_IMG_URL_RE = re.compile(r'(https://image\.slidesharecdn\.com/[^"\'\s]+/\d+/[^"\'\s]+-\d+-\d+\.jpg)')
+_SLIDE_IMG_JSON_RE = re.compile(r'"slideImageUrl"\s*:\s*"([^"]+)"')
+_ESCAPE_RE = re.compile(r'\\u002F|\\/')
+_SLIDE_NUM_RE = re.compile(r'-(\d+)-\d+\.jpg')
+_SAFE_NAME_RE = re.compile(r'[^\w\-\s]')
+
 
 def validate_slideshare_url(url):
     if not url:
         return False, "Please provide a URL"
     
+    if len(url) > MAX_URL_LENGTH:
+        return False, "URL is too long"
+    
+    return check_slideshare_url(url)
+
+
+@lru_cache(maxsize=1024)
+def check_slideshare_url(url):
+    if not url[:8].lower().startswith(('https://', 'http://')):
+        return False, "Please provide a valid SlideShare URL (https://www.slideshare.net/...)"
+    
     try:
         parsed = urlparse(url)
-        valid_domains = ['www.slideshare.net', 'slideshare.net', 'pt.slideshare.net', 
-                         'de.slideshare.net', 'es.slideshare.net', 'fr.slideshare.net']
-        if parsed.netloc not in valid_domains:
+        if parsed.netloc not in _VALID_DOMAINS:
             return False, "Please provide a valid SlideShare URL (https://www.slideshare.net/...)"
         if not parsed.path or parsed.path == '/':
             return False, "Invalid SlideShare presentation URL"
@@ -51,151 +122,353 @@ def validate_slideshare_url(url):
         return False, f"Invalid URL format: {str(e)}"
 
 
+def canonical_slideshare_url(url):
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path.rstrip('/')}"
+
+
 def extract_slide_images(url):
+    key = canonical_slideshare_url(url)
+    with _EXTRACT_LOCK:
+        cached = _EXTRACT_CACHE.get(key) or _EXTRACT_MISS_CACHE.get(key)
+    if cached:
+        return cached
+    
     try:
-        response = requests.get(url, headers=HEADERS, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        next_data = soup.select_one('#__NEXT_DATA__')
-        if next_data:
-            try:
-                data = json.loads(next_data.text)
-                slideshow = data.get('props', {}).get('pageProps', {}).get('slideshow', {})
-                slides = slideshow.get('slides', {})
-                total_slides = slideshow.get('totalSlides', 0)
-                
-                if slides and total_slides > 0:
-                    host = slides.get('host', '')
-                    image_location = slides.get('imageLocation', '')
-                    title = slides.get('title', '')
-                    image_sizes = slides.get('imageSizes', [])
-                    
-                    if host and image_location and title and image_sizes:
-                        best_size = image_sizes[-1]
-                        quality = best_size.get('quality', 100)
-                        width = best_size.get('width', 1280)
-                        
-                        image_urls = []
-                        for i in range(1, total_slides + 1):
-                            img_url = f"{host}/{image_location}/{quality}/{title}-{i}-{width}.jpg"
-                            image_urls.append(img_url)
-                        
-                        return image_urls, title, f"Found {len(image_urls)} slides"
-            except (json.JSONDecodeError, KeyError):
-                pass
-        
-        image_urls = extract_images_fallback(soup, response.text)
-        if image_urls:
-            return image_urls, "presentation", f"Found {len(image_urls)} slides"
-        
-        return None, None, "Could not find slide images. The presentation may be private or SlideShare's format has changed."
-        
+        result = scrape_slide_images(url)
     except requests.exceptions.Timeout:
         return None, None, "Request timed out. Please try again."
+    except requests.exceptions.HTTPError as e:
+        result = None, None, f"Failed to fetch presentation: {str(e)}"
+        status = e.response.status_code if e.response is not None else 0
+        if not 400 <= status < 500 or status == 429:
+            return result
     except requests.exceptions.RequestException as e:
         return None, None, f"Failed to fetch presentation: {str(e)}"
     except Exception as e:
         return None, None, f"Error extracting slides: {str(e)}"
+    
+    with _EXTRACT_LOCK:
+        if result[0]:
+            _EXTRACT_CACHE[key] = result
+        else:
+            _EXTRACT_MISS_CACHE[key] = result
+    return result
 
 
-def extract_images_fallback(soup, html_content):
-    urls = []
+def scrape_slide_images(url):
+    response = SESSION.get(url, timeout=20)
+    response.raise_for_status()
+    
+    next_data = find_next_data(response.text)
+    if next_data:
+        try:
+            data = orjson.loads(next_data)
+            slideshow = data.get('props', {}).get('pageProps', {}).get('slideshow', {})
+            slides = slideshow.get('slides', {})
+            total_slides = slideshow.get('totalSlides', 0)
+            
+            if slides and total_slides > 0:
+                host = slides.get('host', '')
+                image_location = slides.get('imageLocation', '')
+                title = slides.get('title', '')
+                image_sizes = slides.get('imageSizes', [])
+                
+                if host and image_location and title and image_sizes:
+                    best_size = image_sizes[-1]
+                    quality = best_size.get('quality', 100)
+                    width = best_size.get('width', 1280)
+                    
+                    image_urls = []
+                    for i in range(1, total_slides + 1):
+                        img_url = f"{host}/{image_location}/{quality}/{title}-{i}-{width}.jpg"
+                        image_urls.append(img_url)
+                    
+                    return image_urls, title, f"Found {len(image_urls)} slides"
+        except (orjson.JSONDecodeError, KeyError):
+            pass
     
-    patterns = [
-        r'https://image\.slidesharecdn\.com/[^"\'\s]+/\d+/[^"\'\s]+-\d+-\d+\.jpg',
-        r'"slideImageUrl"\s*:\s*"([^"]+)"',
-    ]
+    image_urls = extract_images_fallback(response.text)
+    if image_urls:
+        return image_urls, "presentation", f"Found {len(image_urls)} slides"
     
-    for pattern in patterns:
-        matches = re.findall(pattern, html_content)
-        for match in matches:
-            url = match.replace('\\u002F', '/').replace('\\/', '/')
-            if url.startswith('http') and 'slidesharecdn.com' in url:
-                urls.append(url)
+    return None, None, "Could not find slide images. The presentation may be private or SlideShare's format has changed."
+
+
+def find_next_data(html_content):
+    start = html_content.find('id="__NEXT_DATA__"')
+    if start != -1:
+        start = html_content.find('>', start) + 1
+        end = html_content.find('</script>', start)
+        if start and end != -1:
+            return html_content[start:end]
+    elif '__NEXT_DATA__' not in html_content:
+        return None
     
+    node = LexborHTMLParser(html_content).css_first('#__NEXT_DATA__')
+    return node.text() if node else None
+
+
+def extract_images_fallback(html_content):
     seen = set()
-    cleaned = []
-    for url in urls:
-        base = re.sub(r'\?.*$', '', url)
-        if base not in seen and 'avatar' not in url.lower():
+    slides = []
+    
+    for pattern in (_SLIDE_IMG_JSON_RE, _IMG_URL_RE):
+        for match in pattern.finditer(html_content):
+            url = _ESCAPE_RE.sub('/', match.group(1))
+            if not url.startswith('http') or 'slidesharecdn.com' not in url:
+                continue
+            if 'avatar' in url.lower():
+                continue
+            base = url.partition('?')[0]
+            if base in seen:
+                continue
             seen.add(base)
-            cleaned.append(url)
+            slide_num = _SLIDE_NUM_RE.search(url)
+            slides.append((int(slide_num.group(1)) if slide_num else 0, url))
     
-    def get_slide_num(u):
-        match = re.search(r'-(\d+)-\d+\.jpg', u)
-        return int(match.group(1)) if match else 0
+    slides.sort(key=lambda slide: slide[0])
+    return [url for _, url in slides]
+
+
+@lru_cache(maxsize=1)
+def image_cache_dir():
+    try:
+        path = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'slideshare-downloader'
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        info = path.lstat()
+    except (OSError, RuntimeError):
+        return None
     
-    cleaned.sort(key=get_slide_num)
-    return cleaned
+    if not hasattr(os, 'getuid') or not stat.S_ISDIR(info.st_mode):
+        return None
+    if info.st_uid != os.getuid() or info.st_mode & 0o077:
+        return None
+    return path
+
 
+def image_cache_path(url):
+    cache_dir = image_cache_dir()
+    if cache_dir is None:
+        return None
+    return cache_dir / hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
 
-def download_single_image(args):
-    url, index = args
+
+def read_cached_image(path):
     try:
-        response = SESSION.get(url, timeout=10)
-        response.raise_for_status()
-        return (index, response.content, None)
-    except Exception as e:
-        return (index, None, str(e))
+        content = path.read_bytes()
+    except OSError:
+        return None
+    if not content:
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return content
 
 
-def download_images_fast(image_urls):
-    results = [None] * len(image_urls)
+def store_cached_image(path, content):
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def sweep_image_cache():
+    global _LAST_CACHE_SWEEP
     
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        futures = {executor.submit(download_single_image, (url, i)): i 
-                   for i, url in enumerate(image_urls)}
-        
-        for future in as_completed(futures):
-            index, img_bytes, error = future.result()
-            if img_bytes:
-                results[index] = img_bytes
+    cache_dir = image_cache_dir()
+    if cache_dir is None:
+        return
+    with _SWEEP_LOCK:
+        now = time.monotonic()
+        if now - _LAST_CACHE_SWEEP < IMAGE_CACHE_SWEEP_INTERVAL:
+            return
+        _LAST_CACHE_SWEEP = now
     
+    entries = []
+    try:
+        for entry in os.scandir(cache_dir):
+            try:
+                info = entry.stat()
+            except OSError:
+                continue
+            entries.append((info.st_mtime, info.st_size, entry.path))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= IMAGE_CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        total -= size
+
+
+async def download_single_image(client, url, transform=None):
+    try:
+        cache_path = image_cache_path(url)
+        content = await asyncio.to_thread(read_cached_image, cache_path) if cache_path else None
+        if content is None:
+            response = await client.get(url)
+            response.raise_for_status()
+            content = response.content
+            if cache_path and is_slide_image(content):
+                await asyncio.to_thread(store_cached_image, cache_path, content)
+        if transform is None:
+            return content
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(IMAGE_POOL, transform, content)
+    except Exception:
+        return None
+
+
+def image_loop():
+    global _IMAGE_LOOP, _IMAGE_LOOP_PID, _IMAGE_CLIENT
+    
+    with _IMAGE_LOOP_LOCK:
+        if _IMAGE_LOOP is None or _IMAGE_LOOP_PID != os.getpid():
+            _IMAGE_LOOP = new_event_loop()
+            _IMAGE_LOOP_PID = os.getpid()
+            _IMAGE_CLIENT = None
+            threading.Thread(target=_IMAGE_LOOP.run_forever, name='slide-image-loop', daemon=True).start()
+        return _IMAGE_LOOP
+
+
+def image_client():
+    global _IMAGE_CLIENT
+    
+    if _IMAGE_CLIENT is None:
+        transport = httpx.AsyncHTTPTransport(http2=True, limits=IMAGE_LIMITS, retries=IMAGE_RETRIES)
+        _IMAGE_CLIENT = httpx.AsyncClient(transport=transport, headers=IMAGE_HEADERS, timeout=10.0)
+    return _IMAGE_CLIENT
+
+
+async def download_images_async(image_urls, transform=None):
+    client = image_client()
+    return await asyncio.gather(*(download_single_image(client, url, transform) for url in image_urls))
+
+
+def download_images_fast(image_urls, transform=None):
+    future = asyncio.run_coroutine_threadsafe(download_images_async(image_urls, transform), image_loop())
+    results = future.result()
+    sweep_image_cache()
     return [b for b in results if b is not None]
 
 
+def is_jpeg(img_bytes):
+    return img_bytes[:3] == b'\xff\xd8\xff'
+
+
+def is_slide_image(img_bytes):
+    if is_jpeg(img_bytes) or img_bytes[:8] == b'\x89PNG\r\n\x1a\n':
+        return True
+    return img_bytes[:4] == b'RIFF' and img_bytes[8:12] == b'WEBP'
+
+
+def jpeg_header(img_bytes):
+    i = 2
+    while i + 4 <= len(img_bytes):
+        if img_bytes[i] != 0xFF:
+            return None
+        marker = img_bytes[i + 1]
+        if marker == 0xFF:
+            i += 1
+            continue
+        if marker in JPEG_SOF_MARKERS:
+            if i + 10 > len(img_bytes):
+                return None
+            height, width = struct.unpack_from('>HH', img_bytes, i + 5)
+            return width, height, img_bytes[i + 9]
+        i += 2 + struct.unpack_from('>H', img_bytes, i + 2)[0]
+    return None
+
+
+@lru_cache(maxsize=4)
+def white_canvas(size):
+    return Image.new('RGBA', size, (255, 255, 255, 255))
+
+
+def flatten_for_jpeg(img):
+    if img.mode in ('RGB', 'L'):
+        return img
+    if img.mode in ('RGBA', 'LA', 'P'):
+        if img.mode != 'RGBA':
+            img = img.convert('RGBA')
+        return Image.alpha_composite(white_canvas(img.size), img).convert('RGB')
+    return img.convert('RGB')
+
+
+def encode_jpeg(img, quality):
+    try:
+        buf = _JPEG_BUFFERS.get_nowait()
+    except queue.Empty:
+        buf = io.BytesIO()
+    try:
+        buf.seek(0)
+        img.save(buf, format='JPEG', quality=quality)
+        size = buf.tell()
+        with buf.getbuffer() as view:
+            return bytes(view[:size])
+    finally:
+        _JPEG_BUFFERS.put(buf)
+
+
+def normalize_for_pdf(img_bytes):
+    if is_jpeg(img_bytes):
+        return img_bytes
+    
+    img = Image.open(io.BytesIO(img_bytes), formats=IMAGE_FORMATS)
+    if img.format != 'WEBP' and img.mode in ('RGB', 'L'):
+        return img_bytes
+    
+    return encode_jpeg(flatten_for_jpeg(img), 90)
+
+
+def prep_for_pptx(img_bytes, max_size=PPTX_MAX_SIZE):
+    header = jpeg_header(img_bytes) if is_jpeg(img_bytes) else None
+    if header and header[2] in (1, 3) and header[0] <= max_size[0] and header[1] <= max_size[1]:
+        return img_bytes, header[:2]
+    
+    img = flatten_for_jpeg(Image.open(io.BytesIO(img_bytes), formats=IMAGE_FORMATS))
+    img.thumbnail(max_size, Image.Resampling.LANCZOS)
+    return encode_jpeg(img, 85), img.size
+
+
+def normalize_for_pptx(img_bytes, max_size=PPTX_MAX_SIZE):
+    return prep_for_pptx(img_bytes, max_size)[0]
+
+
 def create_pdf_fast(image_bytes_list):
     if not image_bytes_list:
         return None, "No images to convert"
     
     try:
-        processed_images = []
-        for img_bytes in image_bytes_list:
-            img = Image.open(io.BytesIO(img_bytes))
-            if img.format == 'WEBP' or img.mode not in ('RGB', 'L'):
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    if img.mode in ('RGBA', 'LA'):
-                        background.paste(img, mask=img.split()[-1])
-                    else:
-                        background.paste(img)
-                    img = background
-                else:
-                    img = img.convert('RGB')
-                out = io.BytesIO()
-                img.save(out, format='JPEG', quality=90)
-                processed_images.append(out.getvalue())
-            else:
-                processed_images.append(img_bytes)
-        
-        pdf_content = img2pdf.convert(processed_images)
-        if pdf_content is None:
-            return None, "Failed to convert images to PDF"
+        processed_images = list(IMAGE_POOL.map(normalize_for_pdf, image_bytes_list))
         
-        pdf_bytes = io.BytesIO()
-        pdf_bytes.write(pdf_content)
-        pdf_bytes.seek(0)
+        pdf_file = tempfile.TemporaryFile()
+        img2pdf.convert([io.BytesIO(img_bytes) for img_bytes in processed_images], outputstream=pdf_file)
+        pdf_file.seek(0)
         
-        return pdf_bytes, "PDF created successfully"
+        return pdf_file, "PDF created successfully"
         
     except Exception as e:
         return None, f"Failed to create PDF: {str(e)}"
 
 
-def create_pptx_fast(image_bytes_list):
+def create_pptx_fast(image_bytes_list, max_size=PPTX_MAX_SIZE):
     if not image_bytes_list:
         return None, "No images to convert"
     
@@ -209,30 +482,11 @@ def create_pptx_fast(image_bytes_list):
         slide_height = 7.5
         slide_aspect = slide_width / slide_height
         
-        for img_bytes in image_bytes_list:
+        for img_bytes, (img_width, img_height) in IMAGE_POOL.map(partial(prep_for_pptx, max_size=max_size), image_bytes_list):
             slide = prs.slides.add_slide(blank_layout)
             
-            img = Image.open(io.BytesIO(img_bytes))
-            img_width, img_height = img.size
             img_aspect = img_width / img_height
             
-            if img.format == 'WEBP' or img.mode not in ('RGB', 'L'):
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    if img.mode in ('RGBA', 'LA'):
-                        background.paste(img, mask=img.split()[-1])
-                    else:
-                        background.paste(img)
-                    img = background
-                else:
-                    img = img.convert('RGB')
-            
-            img_stream = io.BytesIO()
-            img.save(img_stream, format='JPEG', quality=85)
-            img_stream.seek(0)
-            
             if img_aspect > slide_aspect:
                 width = Inches(slide_width)
                 height = Inches(slide_width / img_aspect)
@@ -244,13 +498,13 @@ def create_pptx_fast(image_bytes_list):
                 left = Inches((slide_width - slide_height * img_aspect) / 2)
                 top = Inches(0)
             
-            slide.shapes.add_picture(img_stream, left, top, width, height)
+            slide.shapes.add_picture(io.BytesIO(img_bytes), left, top, width, height)
         
-        pptx_bytes = io.BytesIO()
-        prs.save(pptx_bytes)
-        pptx_bytes.seek(0)
+        pptx_file = tempfile.TemporaryFile()
+        prs.save(pptx_file)
+        pptx_file.seek(0)
         
-        return pptx_bytes, "PPTX created successfully"
+        return pptx_file, "PPTX created successfully"
         
     except Exception as e:
         return None, f"Failed to create PPTX: {str(e)}"
@@ -346,6 +600,8 @@ BLOG_ARTICLES = {
     }
 }
 
+_RENDERED_ARTICLES = {}
+
 
 @app.route('/')
 def index():
@@ -362,7 +618,16 @@ def blog_article(slug):
     article = BLOG_ARTICLES.get(slug)
     if not article:
         return render_template('blog.html'), 404
-    return render_template('article.html', article=article)
+    
+    key = (slug, datetime.now().year)
+    html = _RENDERED_ARTICLES.get(key)
+    if html is None or app.jinja_env.auto_reload:
+        html = _RENDERED_ARTICLES[key] = render_template('article.html', article=article)
+    
+    response = Response(html, mimetype='text/html')
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response
 
 
 @app.route('/dmca')
@@ -387,22 +652,30 @@ def disclaimer():
 
 @app.route('/sitemap.xml')
 def sitemap():
-    try:
-        with open('sitemap.xml', 'r') as f:
-            content = f.read()
-        return Response(content, mimetype='application/xml')
-    except FileNotFoundError:
-        return "Sitemap not found", 404
+    return send_from_directory(app.root_path, 'sitemap.xml', mimetype='application/xml', max_age=3600)
 
 
 @app.route('/robots.txt')
 def robots():
-    try:
-        with open('robots.txt', 'r') as f:
-            content = f.read()
-        return Response(content, mimetype='text/plain')
-    except FileNotFoundError:
-        return "Robots.txt not found", 404
+    return send_from_directory(app.root_path, 'robots.txt', mimetype='text/plain', max_age=3600)
+
+
+def send_document(document, mimetype, download_name):
+    size = document.seek(0, io.SEEK_END)
+    document.seek(0)
+    
+    response = send_file(
+        document,
+        mimetype=mimetype,
+        as_attachment=True,
+        download_name=download_name,
+        conditional=False
+    )
+    response.content_length = size
+    response.headers.pop('Expires', None)
+    response.headers['Cache-Control'] = 'no-store'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
 
 
 @app.route('/download', methods=['POST'])
@@ -419,38 +692,44 @@ def download():
         if format_type not in ['pdf', 'pptx']:
             return jsonify({'success': False, 'error': 'Invalid format. Choose PDF or PPTX'}), 400
         
+        max_size = PPTX_MAX_SIZE
+        max_dimension = data.get('max_dimension')
+        if format_type == 'pptx' and max_dimension is not None:
+            try:
+                max_dimension = int(max_dimension)
+            except (TypeError, ValueError):
+                max_dimension = 0
+            if not 256 <= max_dimension <= 8192:
+                return jsonify({'success': False, 'error': 'max_dimension must be between 256 and 8192'}), 400
+            max_size = (max_dimension, max_dimension)
+        
         image_urls, title, extract_message = extract_slide_images(url)
         if not image_urls:
             return jsonify({'success': False, 'error': extract_message}), 400
         
-        image_bytes_list = download_images_fast(image_urls)
+        transform = normalize_for_pdf if format_type == 'pdf' else partial(normalize_for_pptx, max_size=max_size)
+        image_bytes_list = download_images_fast(image_urls, transform)
         if not image_bytes_list:
             return jsonify({'success': False, 'error': 'Failed to download slide images'}), 400
         
         filename_base = title if title else 'presentation'
-        filename_base = re.sub(r'[^\w\-\s]', '_', filename_base.strip())[:100]
+        filename_base = _SAFE_NAME_RE.sub('_', filename_base.strip())[:100]
         
         if format_type == 'pdf':
-            file_bytes, create_message = create_pdf_fast(image_bytes_list)
-            if not file_bytes:
+            document, create_message = create_pdf_fast(image_bytes_list)
+            if not document:
                 return jsonify({'success': False, 'error': create_message}), 500
             
-            return send_file(
-                file_bytes,
-                mimetype='application/pdf',
-                as_attachment=True,
-                download_name=f'{filename_base}.pdf'
-            )
+            return send_document(document, 'application/pdf', f'{filename_base}.pdf')
         else:
-            file_bytes, create_message = create_pptx_fast(image_bytes_list)
-            if not file_bytes:
+            document, create_message = create_pptx_fast(image_bytes_list, max_size)
+            if not document:
                 return jsonify({'success': False, 'error': create_message}), 500
             
-            return send_file(
-                file_bytes,
-                mimetype='application/vnd.openxmlformats-officedocument.presentationml.presentation',
-                as_attachment=True,
-                download_name=f'{filename_base}.pptx'
+            return send_document(
+                document,
+                'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+                f'{filename_base}.pptx'
             )
             
     except Exception as e:
@@ -463,4 +742,4 @@ def health():
 
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, debug=os.environ.get('FLASK_DEBUG') == '1')
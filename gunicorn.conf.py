@@ -0,0 +1,8 @@
+import os
+
+bind = '0.0.0.0:5000'
+workers = int(os.environ.get('WEB_CONCURRENCY', 2 * (os.cpu_count() or 1) + 1))
+worker_class = 'gthread'
+threads = 8
+keepalive = 30
+timeout = 120